@@ -2,14 +2,37 @@
 
 import os
 import sys
+import re
 import json
+import errno
+import pickle
 import logging
+import typing
+import threading
+import functools
 import requests
-from typing import Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, List, Union
 
 
 # External library
 from rich.console import Console
+from rich.text import Text
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 # Internal utilities
@@ -20,9 +43,241 @@ from StreamingCommunity.Util.headers import get_userAgent
 console = Console()
 download_site_data = True
 validate_github_config = True
+_MISSING = object()
+_interactive = os.environ.get('SC_QUIET') != '1' and console.is_terminal
+_markup_tag = re.compile(r'\[/?[a-z ]*\]')
+
+
+class ConfigDownloadError(OSError):
+    """Raised when a configuration file cannot be downloaded."""
+
+
+def _notify(message: Any, level: int = logging.INFO, log: bool = True) -> None:
+    """
+    Show a message on the console when running interactively, otherwise send it to the log as plain text.
+    
+    Args:
+        message (Any): Rich markup string or pre-built Text
+        level (int, optional): Logging level for non-interactive runs. Default: logging.INFO
+        log (bool, optional): Whether to log in non-interactive runs; False when the caller logs the message itself. Default: True
+    """
+    if _interactive:
+        console.print(message)
+    elif not log:
+        return
+    elif isinstance(message, Text):
+        logging.log(level, message.plain)
+    else:
+        logging.log(level, _markup_tag.sub('', message))
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object to 4-space indented JSON bytes, matching the layout of the tracked config.json."""
+    # orjson only supports 2-space indentation, so writes always use the stdlib encoder
+    return json.dumps(obj, indent=4).encode('utf-8')
+
+
+_TRUTHY_STRINGS = frozenset(("1", "true", "t", "yes", "on"))
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a config value to bool, parsing strings such as 'true', 'yes' or '1'."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUTHY_STRINGS
+    return bool(value)
+
+
+def _to_list(value: Any) -> list:
+    """Convert a config value to a list, splitting strings on commas."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',')]
+    return [value]
+
+
+def _to_dict(value: Any) -> dict:
+    """Return a config value that must already be a dict, raising ValueError otherwise."""
+    if isinstance(value, dict):
+        return value
+    raise ValueError(f"Cannot convert {type(value).__name__} to dict")
+
+
+# Typed schema of the known main configuration sections, coerced once at load time
+_SECTION_SCHEMAS = {}
+
+if msgspec is not None:
+    # Every field may be missing, so a trimmed or older config only loses typing for the missing keys
+    _Bool = Union[bool, msgspec.UnsetType]
+    _Int = Union[int, msgspec.UnsetType]
+    _Float = Union[float, msgspec.UnsetType]
+    _Str = Union[str, msgspec.UnsetType]
+    _StrList = Union[List[str], msgspec.UnsetType]
+
+    class DefaultSection(msgspec.Struct):
+        debug: _Bool = msgspec.UNSET
+        show_message: _Bool = msgspec.UNSET
+        clean_console: _Bool = msgspec.UNSET
+        show_trending: _Bool = msgspec.UNSET
+        use_api: _Bool = msgspec.UNSET
+        not_close: _Bool = msgspec.UNSET
+        telegram_bot: _Bool = msgspec.UNSET
+        download_site_data: _Bool = msgspec.UNSET
+        validate_github_config: _Bool = msgspec.UNSET
+
+    class OutFolderSection(msgspec.Struct):
+        root_path: _Str = msgspec.UNSET
+        movie_folder_name: _Str = msgspec.UNSET
+        serie_folder_name: _Str = msgspec.UNSET
+        anime_folder_name: _Str = msgspec.UNSET
+        map_episode_name: _Str = msgspec.UNSET
+        add_siteName: _Bool = msgspec.UNSET
+
+    class M3U8DownloadSection(msgspec.Struct):
+        tqdm_delay: _Float = msgspec.UNSET
+        default_video_workser: _Int = msgspec.UNSET
+        default_audio_workser: _Int = msgspec.UNSET
+        segment_timeout: _Int = msgspec.UNSET
+        download_audio: _Bool = msgspec.UNSET
+        merge_audio: _Bool = msgspec.UNSET
+        specific_list_audio: _StrList = msgspec.UNSET
+        download_subtitle: _Bool = msgspec.UNSET
+        merge_subs: _Bool = msgspec.UNSET
+        specific_list_subtitles: _StrList = msgspec.UNSET
+        cleanup_tmp_folder: _Bool = msgspec.UNSET
+
+    class M3U8ConversionSection(msgspec.Struct):
+        use_codec: _Bool = msgspec.UNSET
+        use_vcodec: _Bool = msgspec.UNSET
+        use_acodec: _Bool = msgspec.UNSET
+        use_bitrate: _Bool = msgspec.UNSET
+        use_gpu: _Bool = msgspec.UNSET
+        default_preset: _Str = msgspec.UNSET
+
+    class M3U8ParserSection(msgspec.Struct):
+        force_resolution: _Str = msgspec.UNSET
+        get_only_link: _Bool = msgspec.UNSET
+
+    class RequestsSection(msgspec.Struct):
+        verify: _Bool = msgspec.UNSET
+        timeout: _Float = msgspec.UNSET
+        max_retry: _Int = msgspec.UNSET
+        proxy: Union[str, dict, msgspec.UnsetType] = msgspec.UNSET
+
+    _SECTION_SCHEMAS = {
+        'DEFAULT': DefaultSection,
+        'OUT_FOLDER': OutFolderSection,
+        'M3U8_DOWNLOAD': M3U8DownloadSection,
+        'M3U8_CONVERSION': M3U8ConversionSection,
+        'M3U8_PARSER': M3U8ParserSection,
+        'REQUESTS': RequestsSection,
+    }
+
+    # Normalize values with the same converters as the untyped path, so both accept the same input
+    _FIELD_CONVERTERS = {_Bool: _to_bool, _Int: int, _Float: float, _StrList: _to_list}
+    _SECTION_CONVERTERS = {
+        section: {
+            name: _FIELD_CONVERTERS[field_type]
+            for name, field_type in typing.get_type_hints(schema).items() if field_type in _FIELD_CONVERTERS
+        }
+        for section, schema in _SECTION_SCHEMAS.items()
+    }
+
+
+def _to_typed_section(section: str, section_data: Any, warn: bool = False) -> Any:
+    """Convert a known section to its typed struct, or return None if it is unknown or does not match the schema."""
+    schema = _SECTION_SCHEMAS.get(section)
+    if schema is None or not isinstance(section_data, dict):
+        return None
+
+    converters = _SECTION_CONVERTERS[section]
+    data = {}
+    for key, value in section_data.items():
+        converter = converters.get(key)
+        if converter is not None:
+            try:
+                value = converter(value)
+            except Exception:
+                # Leave the key unset, so reading it reports the conversion error through the untyped path
+                continue
+        data[key] = value
+
+    try:
+        return msgspec.convert(data, type=schema, strict=False)
+    except msgspec.ValidationError as e:
+        if warn:
+            logging.warning(f"Section '{section}' does not match its schema, using untyped reads: {e}")
+        return None
+
+
+def _atomic_write_file(path: str, data: bytes) -> None:
+    """Write a file through a temp file and os.replace, writing in place where the target cannot be replaced."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        try:
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # Single-file bind mounts (e.g. docker -v ./config.json:/app/config.json) cannot be renamed over
+            if e.errno not in (errno.EBUSY, errno.EXDEV, errno.EPERM):
+                raise
+            with open(path, 'wb') as f:
+                f.write(data)
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+def _flatten(config: dict) -> dict:
+    """Flatten a {section: {key: value}} mapping into {(section, key): value} with interned keys."""
+    return {
+        (sys.intern(section), sys.intern(key)): value
+        for section, section_data in config.items() if isinstance(section_data, dict)
+        for key, value in section_data.items()
+    }
 
 
 class ConfigManager:
+    _CONVERTERS = {
+        int: int,
+        float: float,
+        bool: _to_bool,
+        list: _to_list,
+        dict: _to_dict,
+    }
+    _session: requests.Session = None
+    _request_timeout = (3.05, 15)
+    _cache_maxsize = 1024
+    _stream_parse_threshold = 512 * 1024
+
+    # Static messages, parsed from markup once
+    _MSG_SITE_DATA_DISABLED = Text.from_markup("[bold yellow]Site data download disabled[/bold yellow]")
+    _MSG_DOWNLOADING_REFERENCE = Text.from_markup("[bold yellow]Attempting to download from reference repository...[/bold yellow]")
+    _MSG_VALIDATION_DISABLED = Text.from_markup("[bold yellow]GitHub validation disabled[/bold yellow]")
+    _MSG_RETRIEVING_REFERENCE = Text.from_markup("[bold yellow]Attempting to retrieve reference configuration...[/bold yellow]")
+    _MSG_REFERENCE_LOADED = Text.from_markup("[bold green]Reference configuration loaded successfully[/bold green]")
+    _MSG_EMPTY_CONFIG = Text.from_markup("[bold red]No usable configuration, continuing with an empty one.[/bold red]")
+    _MSG_VALIDATING = Text.from_markup("[bold cyan]Validating configuration with GitHub...[/bold cyan]")
+    _MSG_UP_TO_DATE = Text.from_markup("[bold green]The configuration is up to date.[/bold green]")
+    _MSG_RETRIEVING_SITE_DATA = Text.from_markup("[bold cyan]Retrieving site data from GitHub:[/bold cyan]")
+    _MSG_SITE_DATA_FALLBACK = Text.from_markup("[bold yellow]Attempting fallback to local domains.json file...[/bold yellow]")
+    _MSG_SITE_DATA_FALLBACK_OK = Text.from_markup("[bold green]Fallback to local data successful[/bold green]")
+
     def __init__(self, file_name: str = 'config.json') -> None:
         """
         Initialize the ConfigManager.
@@ -43,10 +298,13 @@ class ConfigManager:
             
         # Initialize file paths
         self.file_path = os.path.join(base_path, file_name)
+        self.cache_path = self.file_path + '.cache.pkl'
         self.domains_path = os.path.join(base_path, 'domains.json')
+        cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        self.site_cache_path = os.path.join(cache_dir, 'streamingcommunity', 'site_config.json')
         
         # Display the actual file path for debugging
-        console.print(f"[bold cyan]Configuration file path:[/bold cyan] [green]{self.file_path}[/green]")
+        _notify(f"[bold cyan]Configuration file path:[/bold cyan] [green]{self.file_path}[/green]")
         
         # Reference repository URL
         self.reference_config_url = 'https://raw.githubusercontent.com/Arrowar/StreamingCommunity/refs/heads/main/config.json'
@@ -54,29 +312,52 @@ class ConfigManager:
         # Initialize data structures
         self.config = {}
         self.configSite = {}
-        self.cache = {}
+        self.cache = OrderedDict()
+        self._rev = {'config': 0, 'site': 0}
+        self._flat = {}
+        self._flat_site = {}
+        self._typed = {}
+        self._site_lock = threading.Lock()
+        self._site_data_loaded = False
+        self._site_future = None
+        self._config_writer = None
 
         self.use_api = False
         self.download_site_data = False
         self.validate_github_config = False
         
-        console.print(f"[bold cyan]Initializing ConfigManager:[/bold cyan] [green]{self.file_path}[/green]")
+        _notify(f"[bold cyan]Initializing ConfigManager:[/bold cyan] [green]{self.file_path}[/green]")
         
         # Load the configuration
         self.load_config()
         
     def load_config(self) -> None:
-        """Load the configuration and initialize all settings."""
-        if not os.path.exists(self.file_path):
-            console.print(f"[bold red]WARNING: Configuration file not found:[/bold red] {self.file_path}")
-            console.print(f"[bold yellow]Attempting to download from reference repository...[/bold yellow]")
-            self._download_reference_config()
-        
+        """Load the configuration and initialize all settings. Site data is loaded in the background and awaited on first access."""
+        self._load_local()
+
+        # Start fetching site data only now, so it uses the settings as updated by the GitHub merge
+        if self.download_site_data:
+            self._prefetch_site_data()
+        else:
+            _notify(self._MSG_SITE_DATA_DISABLED)
+
+    def _load_local(self) -> None:
+        """Load the local configuration file, downloading the reference one if missing."""
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            st = None
+
         # Load the configuration file
         try:
-            with open(self.file_path, 'r') as f:
-                self.config = json.load(f)
-            console.print(f"[bold green]Configuration loaded:[/bold green] {len(self.config)} keys")
+            if st is None:
+                _notify(f"[bold red]WARNING: Configuration file not found:[/bold red] {self.file_path}", logging.WARNING)
+                _notify(self._MSG_DOWNLOADING_REFERENCE, logging.WARNING)
+                self._use_reference_config(self._download_reference_config())
+            else:
+                self.config = self._read_config_file(st)
+            self._reindex('config')
+            _notify(f"[bold green]Configuration loaded:[/bold green] {len(self.config)} keys")
             
             # Update settings from the configuration
             self._update_settings_from_config()
@@ -85,37 +366,144 @@ class ConfigManager:
             if self.validate_github_config:
                 self._validate_and_update_config()
             else:
-                console.print("[bold yellow]GitHub validation disabled[/bold yellow]")
-                
-            # Load site data if requested
-            if self.download_site_data:
-                self._load_site_data()
-            else:
-                console.print("[bold yellow]Site data download disabled[/bold yellow]")
+                _notify(self._MSG_VALIDATION_DISABLED)
                 
+        except ConfigDownloadError:
+            _notify(self._MSG_EMPTY_CONFIG, logging.ERROR)
+            self._use_empty_config()
+
         except json.JSONDecodeError as e:
-            console.print(f"[bold red]Error parsing JSON:[/bold red] {str(e)}")
+            _notify(f"[bold red]Error parsing JSON:[/bold red] {str(e)}", logging.ERROR)
             self._handle_config_error()
 
         except Exception as e:
-            console.print(f"[bold red]Error loading configuration:[/bold red] {str(e)}")
+            _notify(f"[bold red]Error loading configuration:[/bold red] {str(e)}", logging.ERROR)
             self._handle_config_error()
     
+    def _read_config_file(self, st: os.stat_result) -> dict:
+        """
+        Read the configuration file, using the pickle sidecar when it matches the file on disk.
+        
+        Args:
+            st (os.stat_result): Stat of the configuration file
+            
+        Returns:
+            dict: Parsed configuration
+        """
+        header = (st.st_mtime_ns, st.st_size)
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                if pickle.load(f) == header:
+                    return pickle.load(f)
+        except Exception:
+            pass
+
+        with open(self.file_path, 'rb') as f:
+            if ijson is not None and st.st_size > self._stream_parse_threshold:
+                # Parse large files section by section instead of buffering the whole document
+                config = dict(ijson.kvitems(f, '', use_float=True))
+            else:
+                config = _json_loads(f.read())
+
+        self._write_config_cache(header, config)
+        return config
+
+    def _write_config_cache(self, header: tuple, config: dict) -> None:
+        """
+        Write the pickle sidecar for a parsed configuration.
+        
+        Args:
+            header (tuple): (st_mtime_ns, st_size) of the configuration file the data matches
+            config (dict): Parsed configuration
+        """
+        try:
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump(header, f, protocol=5)
+                pickle.dump(config, f, protocol=5)
+        except Exception as e:
+            logging.warning(f"Unable to write configuration cache {self.cache_path}: {e}")
+
+    def _use_reference_config(self, data: bytes) -> None:
+        """
+        Parse a downloaded reference configuration and save it to disk in the background.
+        
+        Args:
+            data (bytes): Raw configuration file content
+        """
+        self.config = _json_loads(data)
+
+        self._config_writer = threading.Thread(target=self._write_config_bytes, args=(data, self.config), daemon=True)
+        self._config_writer.start()
+
+    def _write_config_bytes(self, data: bytes, config: dict) -> None:
+        """
+        Write raw configuration content to the configuration file.
+        
+        Args:
+            data (bytes): Raw configuration file content
+            config (dict): Parsed form of data
+        """
+        try:
+            self._atomic_write(data, config)
+        except OSError as e:
+            logging.error(f"Unable to write configuration file {self.file_path}: {e}")
+
+    def _atomic_write(self, data: bytes, config: dict) -> None:
+        """
+        Replace the configuration file atomically with the given content and re-seed the pickle sidecar.
+        
+        Args:
+            data (bytes): Serialized configuration
+            config (dict): Parsed form of data
+        """
+        # Skip the temp file, fsync and rename when the file already holds these bytes
+        try:
+            with open(self.file_path, 'rb') as f:
+                if f.read() == data:
+                    return
+        except OSError:
+            pass
+
+        self._invalidate_config_cache()
+        _atomic_write_file(self.file_path, data)
+
+        st = os.stat(self.file_path)
+        self._write_config_cache((st.st_mtime_ns, st.st_size), config)
+
+    def _wait_config_writer(self) -> None:
+        """Wait for a pending background write of the configuration file."""
+        if self._config_writer is not None:
+            self._config_writer.join()
+            self._config_writer = None
+
+    def _invalidate_config_cache(self) -> None:
+        """Remove the pickle sidecar so the next load re-parses the configuration file."""
+        try:
+            os.unlink(self.cache_path)
+        except FileNotFoundError:
+            pass
+
     def _handle_config_error(self) -> None:
         """Handle configuration errors by downloading the reference version."""
-        console.print("[bold yellow]Attempting to retrieve reference configuration...[/bold yellow]")
-        self._download_reference_config()
+        _notify(self._MSG_RETRIEVING_REFERENCE, logging.WARNING)
         
         # Reload the configuration
         try:
-            with open(self.file_path, 'r') as f:
-                self.config = json.load(f)
+            self._use_reference_config(self._download_reference_config())
+            self._reindex('config')
             self._update_settings_from_config()
-            console.print("[bold green]Reference configuration loaded successfully[/bold green]")
+            _notify(self._MSG_REFERENCE_LOADED)
         except Exception as e:
-            console.print(f"[bold red]Critical configuration error:[/bold red] {str(e)}")
-            console.print("[bold red]Unable to proceed. The application will terminate.[/bold red]")
-            sys.exit(1)
+            _notify(f"[bold red]Critical configuration error:[/bold red] {str(e)}", logging.ERROR)
+            _notify(self._MSG_EMPTY_CONFIG, logging.ERROR)
+            self._use_empty_config()
+
+    def _use_empty_config(self) -> None:
+        """Continue with an empty configuration when no usable one could be loaded or downloaded."""
+        self.config = {}
+        self._reindex('config')
+        self._update_settings_from_config()
     
     def _update_settings_from_config(self) -> None:
         """Update internal settings from loaded configurations."""
@@ -131,43 +519,93 @@ class ConfigManager:
         self.download_site_data = temp_download_site_data
         self.validate_github_config = temp_validate_github_config
         
-        console.print(f"[bold cyan]API Usage:[/bold cyan] [{'green' if self.use_api else 'yellow'}]{self.use_api}[/{'green' if self.use_api else 'yellow'}]")
-        console.print(f"[bold cyan]Site data download:[/bold cyan] [{'green' if self.download_site_data else 'yellow'}]{self.download_site_data}[/{'green' if self.download_site_data else 'yellow'}]")
-        console.print(f"[bold cyan]GitHub configuration validation:[/bold cyan] [{'green' if self.validate_github_config else 'yellow'}]{self.validate_github_config}[/{'green' if self.validate_github_config else 'yellow'}]")
+        _notify(f"[bold cyan]API Usage:[/bold cyan] [{'green' if self.use_api else 'yellow'}]{self.use_api}[/{'green' if self.use_api else 'yellow'}]")
+        _notify(f"[bold cyan]Site data download:[/bold cyan] [{'green' if self.download_site_data else 'yellow'}]{self.download_site_data}[/{'green' if self.download_site_data else 'yellow'}]")
+        _notify(f"[bold cyan]GitHub configuration validation:[/bold cyan] [{'green' if self.validate_github_config else 'yellow'}]{self.validate_github_config}[/{'green' if self.validate_github_config else 'yellow'}]")
     
-    def _download_reference_config(self) -> None:
-        """Download the reference configuration from GitHub."""
-        console.print(f"[bold cyan]Downloading reference configuration:[/bold cyan] [green]{self.reference_config_url}[/green]")
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Returns:
+            requests.Session: Session with connection pooling and retries
+        """
+        if cls._session is None:
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({'User-Agent': get_userAgent()})
+            cls._session = session
+
+        return cls._session
+
+    def _write_response(self, response: requests.Response, filename: str) -> int:
+        """
+        Stream a response body to a file.
+        
+        Args:
+            response (requests.Response): Response opened with stream=True
+            filename (str): Local filename to save to
+            
+        Returns:
+            int: Number of bytes written
+        """
+        written = 0
+        with open(filename, 'wb') as f:
+            for chunk in response.iter_content(64 * 1024):
+                f.write(chunk)
+                written += len(chunk)
+
+        return written
+
+    def _download_reference_config(self) -> bytes:
+        """
+        Download the reference configuration from GitHub.
+        
+        Returns:
+            bytes: Raw configuration file content
+        """
+        _notify(f"[bold cyan]Downloading reference configuration:[/bold cyan] [green]{self.reference_config_url}[/green]")
 
         try:
-            response = requests.get(self.reference_config_url, timeout=8, headers={'User-Agent': get_userAgent()}, verify=self.get_bool('REQUESTS', 'verify'))
+            # The local configuration is missing or broken here, so its verify setting may not be readable
+            verify = self.config.get('REQUESTS', {}).get('verify', True)
+            response = self._get_session().get(self.reference_config_url, timeout=self._request_timeout, verify=verify)
             
             if response.status_code == 200:
-                with open(self.file_path, 'wb') as f:
-                    f.write(response.content)
                 file_size = len(response.content) / 1024
-                console.print(f"[bold green]Download complete:[/bold green] {os.path.basename(self.file_path)} ({file_size:.2f} KB)")
+                _notify(f"[bold green]Download complete:[/bold green] {os.path.basename(self.file_path)} ({file_size:.2f} KB)")
+                return response.content
             else:
 
                 error_msg = f"HTTP Error: {response.status_code}, Response: {response.text[:100]}"
-                console.print(f"[bold red]Download failed:[/bold red] {error_msg}")
-                raise Exception(error_msg)
+                _notify(f"[bold red]Download failed:[/bold red] {error_msg}", logging.ERROR)
+                raise ConfigDownloadError(error_msg)
             
-        except Exception as e:
-            console.print(f"[bold red]Download error:[/bold red] {str(e)}")
+        except ConfigDownloadError:
             raise
+
+        except Exception as e:
+            _notify(f"[bold red]Download error:[/bold red] {str(e)}", logging.ERROR)
+            raise ConfigDownloadError(str(e)) from e
     
     def _validate_and_update_config(self) -> None:
         """Validate the local configuration against the reference one and update missing keys."""
         try:
             # Download the reference configuration
-            console.print(f"[bold cyan]Validating configuration with GitHub...[/bold cyan]")
-            response = requests.get(self.reference_config_url, timeout=8, headers={'User-Agent': get_userAgent()})
+            _notify(self._MSG_VALIDATING)
+            response = self._get_session().get(self.reference_config_url, timeout=self._request_timeout)
             
             if not response.ok:
                 raise Exception(f"Error downloading reference configuration. Code: {response.status_code}")
             
-            reference_config = response.json()
+            reference_config = _json_loads(response.content)
             
             # Compare and update missing keys
             merged_config = self._deep_merge_configs(self.config, reference_config)
@@ -175,24 +613,28 @@ class ConfigManager:
             if merged_config != self.config:
                 added_keys = self._get_added_keys(self.config, merged_config)
                 
-                # Save the merged configuration
-                with open(self.file_path, 'w') as f:
-                    json.dump(merged_config, f, indent=4)
+                # Update the configuration in memory
+                self.config = merged_config
+                self._reindex('config')
+                self._update_settings_from_config()
                 
                 key_examples = ', '.join(added_keys[:5])
                 if len(added_keys) > 5:
                     key_examples += ' and others...'
                     
-                console.print(f"[bold green]Configuration updated with {len(added_keys)} new keys:[/bold green] {key_examples}")
+                _notify(f"[bold green]Configuration updated with {len(added_keys)} new keys:[/bold green] {key_examples}")
                 
-                # Update the configuration in memory
-                self.config = merged_config
-                self._update_settings_from_config()
+                # Save the merged configuration
+                try:
+                    self._wait_config_writer()
+                    self._atomic_write(_json_dumps(merged_config), merged_config)
+                except OSError as e:
+                    _notify(f"[bold red]Error saving merged configuration:[/bold red] {str(e)}", logging.ERROR)
             else:
-                console.print("[bold green]The configuration is up to date.[/bold green]")
+                _notify(self._MSG_UP_TO_DATE)
                 
         except Exception as e:
-            console.print(f"[bold red]Error validating configuration:[/bold red] {str(e)}")
+            _notify(f"[bold red]Error validating configuration:[/bold red] {str(e)}", logging.ERROR)
     
     def _get_added_keys(self, old_config: dict, new_config: dict, prefix="") -> list:
         """
@@ -260,73 +702,203 @@ class ConfigManager:
                 
         return merged
     
+    def _reindex(self, scope: str) -> None:
+        """
+        Rebuild the flat (section, key) index of a configuration and invalidate its cached reads.
+        
+        Args:
+            scope (str): 'config' for the main configuration, 'site' for the site configuration
+        """
+        if scope == 'site':
+            self._flat_site = _flatten(self.configSite)
+        else:
+            self._flat = _flatten(self.config)
+            self._typed = {}
+            for section, section_data in self.config.items():
+                typed_section = _to_typed_section(section, section_data, warn=True)
+                if typed_section is not None:
+                    self._typed[section] = typed_section
+
+        self._rev[scope] += 1
+
+    def _ensure_site_config(self) -> None:
+        """Wait for the background site data load, or load site data now if none was started."""
+        if self._site_data_loaded:
+            return
+
+        with self._site_lock:
+            if self._site_data_loaded:
+                return
+
+            future, self._site_future = self._site_future, None
+            try:
+                if future is not None:
+                    future.result()
+                elif self.download_site_data:
+                    self._load_site_data()
+
+            except Exception as e:
+                _notify(f"[bold red]Error loading site data:[/bold red] {str(e)}", logging.ERROR)
+                self.configSite = {}
+                self._reindex('site')
+
+            finally:
+                self._site_data_loaded = True
+
+    def _prefetch_site_data(self) -> None:
+        """Start loading site data in a background thread, if site data download is enabled."""
+        if not self.download_site_data or self._site_future is not None:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._site_future = executor.submit(self._load_site_data)
+        executor.shutdown(wait=False)
+
     def _load_site_data(self) -> None:
         """Load site data from API or local file."""
         if self.use_api:
             self._load_site_data_from_api()
         else:
             self._load_site_data_from_file()
+
+        self._reindex('site')
     
     def _load_site_data_from_api(self) -> None:
         """Load site data from GitHub."""
         domains_github_url = "https://raw.githubusercontent.com/Arrowar/StreamingCommunity/refs/heads/main/.github/.domain/domains.json"
-        headers = {
-            "User-Agent": get_userAgent()
-        }
         
         try:
-            console.print("[bold cyan]Retrieving site data from GitHub:[/bold cyan]")
-            response = requests.get(domains_github_url, timeout=8, headers=headers, verify=self.get_bool('REQUESTS', 'verify'))
+            _notify(self._MSG_RETRIEVING_SITE_DATA)
 
-            if response.ok:
-                self.configSite = response.json()
+            # Ask only for changes since the cached copy, if there is one
+            cached_data, cached_meta = self._read_site_cache()
+            headers = {}
+            if cached_data is not None:
+                if cached_meta.get('etag'):
+                    headers['If-None-Match'] = cached_meta['etag']
+                if cached_meta.get('last_modified'):
+                    headers['If-Modified-Since'] = cached_meta['last_modified']
+
+            verify = self.get_bool('REQUESTS', 'verify')
+            response = self._get_session().get(domains_github_url, headers=headers, timeout=self._request_timeout, verify=verify)
+
+            if response.status_code == 304 and cached_data is not None:
+                try:
+                    self.configSite = _json_loads(cached_data)
+
+                    site_count = len(self.configSite) if isinstance(self.configSite, dict) else 0
+                    _notify(f"[bold green]Site data unchanged on GitHub, using cache:[/bold green] {site_count} streaming services found.")
+                    return
+
+                except ValueError as e:
+                    _notify(f"[bold yellow]Cached site data is corrupt, downloading it again:[/bold yellow] {str(e)}", logging.WARNING)
+                    self._clear_site_cache()
+                    response = self._get_session().get(domains_github_url, timeout=self._request_timeout, verify=verify)
+
+            if response.ok and response.status_code != 304:
+                self.configSite = _json_loads(response.content)
+                self._write_site_cache(response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
                 
                 site_count = len(self.configSite) if isinstance(self.configSite, dict) else 0
-                console.print(f"[bold green]Site data loaded from GitHub:[/bold green] {site_count} streaming services found.")
+                _notify(f"[bold green]Site data loaded from GitHub:[/bold green] {site_count} streaming services found.")
                 
             else:
-                console.print(f"[bold red]GitHub request failed:[/bold red] HTTP {response.status_code}, {response.text[:100]}")
+                _notify(f"[bold red]GitHub request failed:[/bold red] HTTP {response.status_code}, {response.text[:100]}", logging.ERROR)
                 self._handle_site_data_fallback()
         
         except json.JSONDecodeError as e:
-            console.print(f"[bold red]Error parsing JSON from GitHub:[/bold red] {str(e)}")
+            _notify(f"[bold red]Error parsing JSON from GitHub:[/bold red] {str(e)}", logging.ERROR)
             self._handle_site_data_fallback()
             
         except Exception as e:
-            console.print(f"[bold red]GitHub connection error:[/bold red] {str(e)}")
+            _notify(f"[bold red]GitHub connection error:[/bold red] {str(e)}", logging.ERROR)
             self._handle_site_data_fallback()
     
+    def _read_site_cache(self) -> tuple:
+        """
+        Read the cached copy of the GitHub site data and its HTTP validators.
+        
+        Returns:
+            tuple: (raw data or None, dict with 'etag' and 'last_modified')
+        """
+        try:
+            with open(self.site_cache_path + '.meta', 'rb') as f:
+                meta = _json_loads(f.read())
+            with open(self.site_cache_path, 'rb') as f:
+                return f.read(), meta
+        except Exception:
+            return None, {}
+
+    def _write_site_cache(self, data: bytes, etag: str, last_modified: str) -> None:
+        """
+        Save the GitHub site data and its HTTP validators for conditional requests.
+        
+        Args:
+            data (bytes): Raw site data
+            etag (str): ETag response header, if any
+            last_modified (str): Last-Modified response header, if any
+        """
+        if not etag and not last_modified:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.site_cache_path), exist_ok=True)
+
+            # Drop the old validators first, so they never describe a different copy of the data
+            self._clear_site_cache(meta_only=True)
+            _atomic_write_file(self.site_cache_path, data)
+            _atomic_write_file(self.site_cache_path + '.meta', _json_dumps({'etag': etag, 'last_modified': last_modified}))
+        except OSError as e:
+            logging.warning(f"Unable to write site data cache {self.site_cache_path}: {e}")
+
+    def _clear_site_cache(self, meta_only: bool = False) -> None:
+        """
+        Remove the cached GitHub site data and its HTTP validators.
+        
+        Args:
+            meta_only (bool, optional): Whether to remove only the validators. Default: False
+        """
+        paths = [self.site_cache_path + '.meta']
+        if not meta_only:
+            paths.append(self.site_cache_path)
+
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
     def _load_site_data_from_file(self) -> None:
         """Load site data from local file."""
         try:
             if os.path.exists(self.domains_path):
-                console.print(f"[bold cyan]Reading domains from:[/bold cyan] {self.domains_path}")
-                with open(self.domains_path, 'r') as f:
-                    self.configSite = json.load(f)
+                _notify(f"[bold cyan]Reading domains from:[/bold cyan] {self.domains_path}")
+                with open(self.domains_path, 'rb') as f:
+                    self.configSite = _json_loads(f.read())
                 
                 site_count = len(self.configSite) if isinstance(self.configSite, dict) else 0
-                console.print(f"[bold green]Site data loaded from file:[/bold green] {site_count} streaming services")
+                _notify(f"[bold green]Site data loaded from file:[/bold green] {site_count} streaming services")
 
             else:
                 error_msg = f"domains.json not found at {self.domains_path} and API usage is disabled"
-                console.print(f"[bold red]Configuration error:[/bold red] {error_msg}")
+                _notify(f"[bold red]Configuration error:[/bold red] {error_msg}", logging.ERROR)
                 self._handle_site_data_fallback()
         
         except Exception as e:
-            console.print(f"[bold red]Domain file error:[/bold red] {str(e)}")
+            _notify(f"[bold red]Domain file error:[/bold red] {str(e)}", logging.ERROR)
             self._handle_site_data_fallback()
     
     def _handle_site_data_fallback(self) -> None:
         """Handle site data fallback in case of error."""
         if self.use_api and os.path.exists(self.domains_path):
-            console.print("[bold yellow]Attempting fallback to local domains.json file...[/bold yellow]")
+            _notify(self._MSG_SITE_DATA_FALLBACK, logging.WARNING)
 
             try:
-                with open(self.domains_path, 'r') as f:
-                    self.configSite = json.load(f)
-                console.print("[bold green]Fallback to local data successful[/bold green]")
+                with open(self.domains_path, 'rb') as f:
+                    self.configSite = _json_loads(f.read())
+                _notify(self._MSG_SITE_DATA_FALLBACK_OK)
             except Exception as fallback_error:
-                console.print(f"[bold red]Fallback also failed:[/bold red] {str(fallback_error)}")
+                _notify(f"[bold red]Fallback also failed:[/bold red] {str(fallback_error)}", logging.ERROR)
                 self.configSite = {}
         else:
 
@@ -343,25 +915,26 @@ class ConfigManager:
         """
         try:
             logging.info(f"Downloading {filename} from {url}...")
-            console.print(f"[bold cyan]File download:[/bold cyan] {os.path.basename(filename)}")
-            response = requests.get(url, timeout=8, headers={'User-Agent': get_userAgent()}, verify=self.get_bool('REQUESTS', 'verify'))
+            _notify(f"[bold cyan]File download:[/bold cyan] {os.path.basename(filename)}", log=False)
+            response = self._get_session().get(url, timeout=self._request_timeout, stream=True, verify=self.get_bool('REQUESTS', 'verify'))
             
             if response.status_code == 200:
-                with open(filename, 'wb') as f:
-                    f.write(response.content)
-                file_size = len(response.content) / 1024
-                console.print(f"[bold green]Download complete:[/bold green] {os.path.basename(filename)} ({file_size:.2f} KB)")
+                file_size = self._write_response(response, filename) / 1024
+                _notify(f"[bold green]Download complete:[/bold green] {os.path.basename(filename)} ({file_size:.2f} KB)")
 
             else:
                 error_msg = f"HTTP Status: {response.status_code}, Response: {response.text[:100]}"
-                console.print(f"[bold red]Download failed:[/bold red] {error_msg}")
+                _notify(f"[bold red]Download failed:[/bold red] {error_msg}", log=False)
                 logging.error(f"Download of {filename} failed. {error_msg}")
-                raise Exception(error_msg)
+                raise ConfigDownloadError(error_msg)
         
+        except ConfigDownloadError:
+            raise
+
         except Exception as e:
-            console.print(f"[bold red]Download error:[/bold red] {str(e)}")
+            _notify(f"[bold red]Download error:[/bold red] {str(e)}", log=False)
             logging.error(f"Download of {filename} failed: {e}")
-            raise
+            raise ConfigDownloadError(str(e)) from e
     
     def get(self, section: str, key: str, data_type: type = str, from_site: bool = False) -> Any:
         """
@@ -376,29 +949,46 @@ class ConfigManager:
         Returns:
             Any: The key value converted to the specified data type
         """
-        cache_key = f"{'site' if from_site else 'config'}.{section}.{key}"
-        logging.info(f"Reading key: {cache_key}")
+        cache_key = (from_site, section, key, data_type)
+        if logging.root.isEnabledFor(logging.INFO):
+            logging.info(f"Reading key: {'site' if from_site else 'config'}.{section}.{key}")
         
-        # Check if the value is in the cache
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        # Known sections already hold values of their schema type
+        if not from_site:
+            typed_section = self._typed.get(section)
+            if typed_section is not None:
+                value = getattr(typed_section, key, _MISSING)
+                if type(value) is data_type:
+                    return value
+
+        # Check if the value is in the cache and still current
+        scope = 'site' if from_site else 'config'
+        cached = self.cache.get(cache_key)
+        if cached is not None and cached[0] == self._rev[scope]:
+            self.cache.move_to_end(cache_key)
+            return cached[1]
         
         # Choose the appropriate source
-        config_source = self.configSite if from_site else self.config
-        
-        # Check if the section and key exist
-        if section not in config_source:
-            raise ValueError(f"Section '{section}' not found in {'site' if from_site else 'main'} configuration")
+        if from_site and not self._site_data_loaded:
+            self._ensure_site_config()
+        flat = self._flat_site if from_site else self._flat
         
-        if key not in config_source[section]:
+        # Get the value, checking that the section and key exist
+        value = flat.get((section, key), _MISSING)
+        if value is _MISSING:
+            config_source = self.configSite if from_site else self.config
+            if section not in config_source:
+                raise ValueError(f"Section '{section}' not found in {'site' if from_site else 'main'} configuration")
             raise ValueError(f"Key '{key}' not found in section '{section}' of {'site' if from_site else 'main'} configuration")
         
-        # Get and convert the value
-        value = config_source[section][key]
+        # Convert the value
         converted_value = self._convert_to_data_type(value, data_type)
         
-        # Save in cache
-        self.cache[cache_key] = converted_value
+        # Save in cache, tagged with the current revision of its source
+        self.cache[cache_key] = (self._rev[scope], converted_value)
+        self.cache.move_to_end(cache_key)
+        if len(self.cache) > self._cache_maxsize:
+            self.cache.popitem(last=False)
         
         return converted_value
     
@@ -413,27 +1003,12 @@ class ConfigManager:
         Returns:
             Any: Converted value
         """
+        converter = self._CONVERTERS.get(data_type)
+        if converter is None:
+            return value
+
         try:
-            if data_type == int:
-                return int(value)
-            elif data_type == float:
-                return float(value)
-            elif data_type == bool:
-                if isinstance(value, str):
-                    return value.lower() in ("yes", "true", "t", "1")
-                return bool(value)
-            elif data_type == list:
-                if isinstance(value, list):
-                    return value
-                if isinstance(value, str):
-                    return [item.strip() for item in value.split(',')]
-                return [value]
-            elif data_type == dict:
-                if isinstance(value, dict):
-                    return value
-                raise ValueError(f"Cannot convert {type(value).__name__} to dict")
-            else:
-                return value
+            return converter(value)
         except Exception as e:
             logging.error(f"Error converting to {data_type.__name__}: {e}")
             raise ValueError(f"Cannot convert '{value}' to {data_type.__name__}: {str(e)}")
@@ -503,6 +1078,8 @@ class ConfigManager:
             to_site (bool, optional): Whether to set in the site configuration. Default: False
         """
         try:
+            if to_site:
+                self._ensure_site_config()
             config_target = self.configSite if to_site else self.config
             
             if section not in config_target:
@@ -510,28 +1087,34 @@ class ConfigManager:
             
             config_target[section][key] = value
             
-            # Update the cache
-            cache_key = f"{'site' if to_site else 'config'}.{section}.{key}"
-            self.cache[cache_key] = value
+            # Update the flat index and invalidate cached reads of this configuration
+            flat = self._flat_site if to_site else self._flat
+            flat[(sys.intern(section), sys.intern(key))] = value
+            if not to_site:
+                self._typed.pop(section, None)
+                typed_section = _to_typed_section(section, config_target[section])
+                if typed_section is not None:
+                    self._typed[section] = typed_section
+            self._rev['site' if to_site else 'config'] += 1
             
             logging.info(f"Key '{key}' set in section '{section}' of {'site' if to_site else 'main'} configuration")
         
         except Exception as e:
             error_msg = f"Error setting key '{key}' in section '{section}' of {'site' if to_site else 'main'} configuration: {e}"
             logging.error(error_msg)
-            console.print(f"[bold red]{error_msg}[/bold red]")
+            _notify(f"[bold red]{error_msg}[/bold red]", log=False)
     
     def save_config(self) -> None:
         """Save the main configuration to file."""
         try:
-            with open(self.file_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            self._wait_config_writer()
+            self._atomic_write(_json_dumps(self.config), self.config)
 
             logging.info(f"Configuration saved to: {self.file_path}")
 
         except Exception as e:
             error_msg = f"Error saving configuration: {e}"
-            console.print(f"[bold red]{error_msg}[/bold red]")
+            _notify(f"[bold red]{error_msg}[/bold red]", log=False)
             logging.error(error_msg)
     
     def get_all_sites(self) -> List[str]:
@@ -541,7 +1124,18 @@ class ConfigManager:
         Returns:
             List[str]: List of site names
         """
+        self._ensure_site_config()
         return list(self.configSite.keys())
+
+    def get_site_data(self) -> dict:
+        """
+        Get the full site configuration.
+        
+        Returns:
+            dict: Site configuration keyed by site name
+        """
+        self._ensure_site_config()
+        return self.configSite
     
     def has_section(self, section: str, in_site: bool = False) -> bool:
         """
@@ -554,6 +1148,8 @@ class ConfigManager:
         Returns:
             bool: True if the section exists, False otherwise
         """
+        if in_site:
+            self._ensure_site_config()
         config_source = self.configSite if in_site else self.config
         return section in config_source
 
@@ -569,5 +1165,19 @@ def get_use_large_bar():
     return not any(platform in sys.platform for platform in ("android", "ios"))
 
 
-# Initialize the ConfigManager when the module is imported
-config_manager = ConfigManager()
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """
+    Get the shared ConfigManager, creating it on first use.
+    
+    Returns:
+        ConfigManager: The shared configuration manager
+    """
+    return ConfigManager()
+
+
+def __getattr__(name: str) -> Any:
+    # Create the shared ConfigManager lazily on `from ... import config_manager`
+    if name == 'config_manager':
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -225,7 +225,7 @@ def main(script_id = 0):
     initialize()
 
     # Get all site hostname
-    hostname_list = [hostname for site_info in config_manager.configSite.values() if (hostname := _extract_hostname(site_info.get('full_url')))]
+    hostname_list = [hostname for site_info in config_manager.get_site_data().values() if (hostname := _extract_hostname(site_info.get('full_url')))]
 
     if not internet_manager.check_dns_resolve(hostname_list):
         print()